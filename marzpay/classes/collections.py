@@ -2,13 +2,50 @@
 Collections API - Money collection from customers via mobile money
 """
 
+import asyncio
+import copy
+import os
 import re
-import uuid
-from typing import Dict, Any, Optional
+import time
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 from ..errors import MarzPayError
 
 
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+
+# str.translate deletion table for ASCII input; avoids the regex engine
+_NON_DIGIT_TABLE = {c: None for c in range(128) if not 48 <= c <= 57}
+
+# Uganda phone number once non-digits are stripped: 0XXXXXXXXX, 256XXXXXXXXX
+# or a bare 9-digit subscriber number (same rule as
+# PhoneNumberUtils.is_valid_uganda_phone_number, plus the bare form)
+_PHONE_RE = re.compile(r'(?:0|256)?[0-9]{9}')
+
+
+def _strip_non_digits(phone_number: str) -> str:
+    """
+    Remove every non-digit character (including +) from a phone number
+    """
+    if phone_number.isascii():
+        return phone_number.translate(_NON_DIGIT_TABLE)
+    return _NON_DIGIT_RE.sub('', phone_number)
+
+
+def _uuid4_str() -> str:
+    """
+    Build a random UUID v4 string directly from os.urandom
+    
+    Equivalent to str(uuid.uuid4()) without constructing a UUID object.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class CollectionsAPI:
     """
     Collections API - Money collection from customers via mobile money
@@ -35,6 +72,9 @@ class CollectionsAPI:
     def __init__(self, client):
         """Initialize CollectionsAPI with MarzPay client"""
         self.client = client
+        # (fetched_at, response) for get_services, reused for _services_ttl seconds
+        self._services_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._services_ttl = 300
 
     def collect_money(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -57,13 +97,12 @@ class CollectionsAPI:
         """
         self._validate_collect_money_params(params)
 
-        # Generate a valid UUID if no reference provided
-        reference = params.get('reference') or self._generate_uuid()
-        
+        # Assemble the payload in one pass; params itself is never mutated
         payload = {
             'amount': str(params['amount']),  # API expects string
             'phone_number': self._format_phone_number(params['phone_number']),
-            'reference': reference,
+            # Generate a valid UUID if no reference provided
+            'reference': params.get('reference') or self._generate_uuid(),
             'description': params.get('description', 'Payment for services'),
             'callback_url': params.get('callback_url'),
             'country': params.get('country', 'UG'),
@@ -71,6 +110,117 @@ class CollectionsAPI:
 
         return self.client.request('/collect-money', method='POST', data=payload, content_type='multipart')
 
+    def make_collector(
+        self,
+        *,
+        callback_url: Optional[str] = None,
+        country: str = 'UG',
+    ) -> Callable[..., Dict[str, Any]]:
+        """
+        Build a collect_money callable with callback_url and country fixed
+        
+        Useful for integrations that send many collections with the same
+        settings.
+        
+        Args:
+            callback_url: Webhook callback URL applied to every collection
+            country: Country code applied to every collection (default: UG)
+        
+        Returns:
+            Callable taking (amount, phone_number, reference=None, description=None)
+            
+        Example:
+            ```python
+            collect = client.collections.make_collector(
+                callback_url="https://example.com/webhook"
+            )
+            result = collect(5000, "0759983853", description="Order #42")
+            ```
+        """
+        base_params = {'callback_url': callback_url, 'country': country}
+
+        def _collect(
+            amount: int,
+            phone_number: str,
+            reference: Optional[str] = None,
+            description: Optional[str] = None,
+        ) -> Dict[str, Any]:
+            params = {**base_params, 'amount': amount, 'phone_number': phone_number}
+            if reference is not None:
+                params['reference'] = reference
+            if description is not None:
+                params['description'] = description
+            return self.collect_money(params)
+
+        return _collect
+
+    async def collect_money_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Collect money without blocking the event loop
+        
+        Runs collect_money in the loop's default executor so the request
+        still goes through the client's pooled HTTP session.
+        
+        Args:
+            params: Parameters for collecting money (see collect_money)
+        
+        Returns:
+            API response with transaction details
+            
+        Raises:
+            MarzPayError: When request fails or validation fails
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.collect_money, params)
+
+    async def collect_many(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrency: int = 10,
+    ) -> List[Union[Dict[str, Any], MarzPayError]]:
+        """
+        Collect money for several customers concurrently
+        
+        All items are validated before any request is sent. After that, a
+        failed request does not stop the others: its MarzPayError is
+        returned in that item's slot, so callers can tell exactly which
+        collections were initiated and retry only the failed ones.
+        
+        Args:
+            items: List of collect_money parameter dictionaries
+            max_concurrency: Maximum number of requests in flight (default: 10)
+        
+        Returns:
+            One entry per item, in the same order as items: the API
+            response, or the MarzPayError raised for that item
+            
+        Raises:
+            MarzPayError: When max_concurrency is below 1, or when any item
+                fails validation (nothing is sent; the message starts with
+                the item index and details["index"] holds it)
+        """
+        if max_concurrency < 1:
+            raise MarzPayError("max_concurrency must be at least 1", "INVALID_MAX_CONCURRENCY", 400)
+
+        for index, params in enumerate(items):
+            try:
+                self._validate_collect_money_params(params)
+            except MarzPayError as e:
+                raise MarzPayError(
+                    f"items[{index}]: {e.message}", e.code, e.status, {**e.details, "index": index}
+                ) from e
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _collect(params: Dict[str, Any]) -> Union[Dict[str, Any], MarzPayError]:
+            async with semaphore:
+                try:
+                    return await self.collect_money_async(params)
+                except MarzPayError as e:
+                    return e
+
+        return list(await asyncio.gather(*(_collect(params) for params in items)))
+
     def get_collection_details(self, uuid: str) -> Dict[str, Any]:
         """
         Get collection details by UUID
@@ -116,34 +266,46 @@ class CollectionsAPI:
         Returns:
             Collections list
         """
-        filters = {}
-        
-        if page is not None:
-            filters["page"] = page
-        if limit is not None:
-            filters["limit"] = limit
-        if status is not None:
-            filters["status"] = status
-        if from_date is not None:
-            filters["from_date"] = from_date
-        if to_date is not None:
-            filters["to_date"] = to_date
-
-        endpoint = "/collections"
-        if filters:
-            query_params = "&".join([f"{k}={v}" for k, v in filters.items()])
-            endpoint += f"?{query_params}"
+        filters = {
+            k: v
+            for k, v in (
+                ("page", page),
+                ("limit", limit),
+                ("status", status),
+                ("from_date", from_date),
+                ("to_date", to_date),
+            )
+            if v is not None
+        }
 
+        # Sorted so identical filter sets always produce the same URL
+        endpoint = "/collections" + (f"?{urlencode(sorted(filters.items()))}" if filters else "")
         return self.client.request(endpoint)
 
     def get_services(self) -> Dict[str, Any]:
         """
         Get available collection services
         
+        The response is cached in memory for five minutes; use
+        invalidate_services() to force a fresh fetch. Each call returns its
+        own copy, so callers may modify the result freely.
+        
         Returns:
             API response with available services
         """
-        return self.client.request('/collect-money/services')
+        cached = self._services_cache
+        if cached is not None and time.monotonic() - cached[0] < self._services_ttl:
+            return copy.deepcopy(cached[1])
+
+        result = self.client.request('/collect-money/services')
+        self._services_cache = (time.monotonic(), copy.deepcopy(result))
+        return result
+
+    def invalidate_services(self) -> None:
+        """
+        Clear the cached get_services response
+        """
+        self._services_cache = None
 
     def generate_reference(self) -> str:
         """
@@ -152,7 +314,7 @@ class CollectionsAPI:
         Returns:
             UUID4 reference string
         """
-        return str(uuid.uuid4())
+        return _uuid4_str()
 
     def _validate_collect_money_params(self, params: Dict[str, Any]) -> None:
         """
@@ -162,16 +324,91 @@ class CollectionsAPI:
             params: Parameters to validate
             
         Raises:
-            MarzPayError: When validation fails
+            MarzPayError: When validation fails (on the first problem found)
+        """
+        error = self._phone_number_error(params) or self._amount_error(params)
+        if error is not None:
+            raise MarzPayError(error[0], error[1], 400)
+
+    def collect_money_errors(self, params: Dict[str, Any]) -> List[str]:
+        """
+        Check collect money parameters without sending a request (dry run)
+        
+        Unlike collect_money, which stops at the first problem, this collects
+        every validation error so they can be reported together. It never
+        raises; an empty list means the parameters are valid.
+        
+        Args:
+            params: Parameters to validate
+            
+        Returns:
+            List of validation error messages (empty when valid)
+        """
+        errors = []
+        
+        for error in (self._phone_number_error(params), self._amount_error(params)):
+            if error is not None:
+                errors.append(error[0])
+        
+        return errors
+
+    def _phone_number_error(self, params: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        Check the phone_number parameter
+        
+        Args:
+            params: Collect money parameters
+            
+        Returns:
+            (message, code) when invalid, otherwise None
         """
         if 'phone_number' not in params:
-            raise MarzPayError("phone_number is required", "MISSING_PHONE_NUMBER", 400)
+            return "phone_number is required", "MISSING_PHONE_NUMBER"
+        if not self._is_valid_phone_number(params['phone_number']):
+            return "phone_number format is invalid", "INVALID_PHONE_NUMBER"
+        return None
+
+    def _amount_error(self, params: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        Check the amount parameter
         
+        Args:
+            params: Collect money parameters
+            
+        Returns:
+            (message, code) when invalid, otherwise None
+        """
         if 'amount' not in params:
-            raise MarzPayError("amount is required", "MISSING_AMOUNT", 400)
+            return "amount is required", "MISSING_AMOUNT"
+        amount = params['amount']
+        if not isinstance(amount, (int, float)) or amount <= 0:
+            return "amount must be a positive number", "INVALID_AMOUNT"
+        return None
+
+    def _is_valid_phone_number(self, phone_number: Any) -> bool:
+        """
+        Check that a phone number is a Uganda number before calling the API
+        
+        Args:
+            phone_number: Raw phone number
+            
+        Returns:
+            True if, once formatting characters are removed, it is 0 or 256
+            followed by 9 digits, or 9 digits on their own
+        """
+        if not isinstance(phone_number, str):
+            return False
+        
+        # Fast path for the common local format, e.g. 0759983853
+        if (
+            len(phone_number) == 10
+            and phone_number[0] == '0'
+            and phone_number.isascii()
+            and phone_number.isdigit()
+        ):
+            return True
         
-        if not isinstance(params['amount'], (int, float)) or params['amount'] <= 0:
-            raise MarzPayError("amount must be a positive number", "INVALID_AMOUNT", 400)
+        return _PHONE_RE.fullmatch(_strip_non_digits(phone_number)) is not None
 
     def _generate_uuid(self) -> str:
         """
@@ -180,7 +417,7 @@ class CollectionsAPI:
         Returns:
             UUID v4 string
         """
-        return str(uuid.uuid4())
+        return _uuid4_str()
 
     def _format_phone_number(self, phone_number: str) -> str:
         """
@@ -192,18 +429,21 @@ class CollectionsAPI:
         Returns:
             Formatted phone number with + prefix
         """
-        # Remove any non-digit characters except +
-        phone_number = re.sub(r'[^\d+]', '', phone_number)
+        # Fast path for the common local format, e.g. 0759983853
+        if (
+            len(phone_number) == 10
+            and phone_number[0] == '0'
+            and phone_number.isascii()
+            and phone_number.isdigit()
+        ):
+            return '+256' + phone_number[1:]
         
-        # Remove + if present
-        phone_number = phone_number.replace('+', '')
+        # Remove any non-digit characters (including +)
+        phone_number = _strip_non_digits(phone_number)
         
-        # Add country code if not present
-        if not phone_number.startswith('256'):
-            if phone_number.startswith('0'):
-                phone_number = '256' + phone_number[1:]
-            else:
-                phone_number = '256' + phone_number
+        # Add country code if not present, dropping a leading trunk 0
+        if phone_number[:3] != '256':
+            phone_number = '256' + (phone_number[1:] if phone_number[:1] == '0' else phone_number)
         
         return '+' + phone_number
 
@@ -4,7 +4,8 @@ Main MarzPay client class
 
 import base64
 import json
-from typing import Dict, Any, Optional
+from types import TracebackType
+from typing import Dict, Any, Optional, Type
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -94,6 +95,9 @@ class MarzPay:
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+        # Send credentials on every pooled request without rebuilding them
+        self.session.headers["Authorization"] = self.get_auth_header()
+
         # Initialize API modules
         self.collections = CollectionsAPI(self)
         self.disbursements = DisbursementsAPI(self)
@@ -135,12 +139,8 @@ class MarzPay:
         """
         url = f"{self.config['base_url']}{endpoint}"
         
-        request_headers = {
-            "Authorization": self.get_auth_header(),
-        }
-        
-        if headers:
-            request_headers.update(headers)
+        # Authorization is set once on the session in __init__/set_credentials
+        request_headers = dict(headers) if headers else {}
 
         # Extract content_type before spreading kwargs
         content_type = kwargs.get('content_type', 'json')
@@ -215,6 +215,29 @@ class MarzPay:
 
         self.config["api_key"] = api_key
         self.config["api_secret"] = api_secret
+        self.session.headers["Authorization"] = self.get_auth_header()
+
+        # Cached responses belong to the previous account
+        self.collections.invalidate_services()
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections
+        """
+        self.session.close()
+
+    def __enter__(self) -> "MarzPay":
+        """Return the client for use in a with statement"""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the HTTP session when leaving the with block"""
+        self.close()
 
     def get_auth_header(self) -> str:
         """
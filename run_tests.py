@@ -3,30 +3,37 @@
 Test runner for MarzPay Python SDK
 """
 
+import importlib.util
 import sys
+import shlex
 import subprocess
 import os
 from pathlib import Path
 
 
 def run_command(command, description):
-    """Run a command and handle errors"""
+    """Run a command (an argv list, no shell) and handle errors"""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
-    print(f"Command: {command}")
+    print(f"Command: {shlex.join(command)}")
     print(f"{'='*60}")
     
-    try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
+    # Stream output as it is produced instead of buffering it all in memory
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    for line in process.stdout:
+        print(line, end="")
+    process.wait()
+    
+    if process.returncode != 0:
+        print(f"Error running command: exit status {process.returncode}")
         return False
+    return True
 
 
 def main():
@@ -38,68 +45,34 @@ def main():
     project_dir = Path(__file__).parent
     os.chdir(project_dir)
     
-    # Check if pytest is available
-    try:
-        import pytest
+    # Check that pytest and the plugins used below are available, without importing them
+    required = {"pytest": "pytest", "xdist": "pytest-xdist", "pytest_cov": "pytest-cov"}
+    missing = [package for module, package in required.items() if importlib.util.find_spec(module) is None]
+    if not missing:
         print("✓ pytest is available")
-    except ImportError:
-        print("✗ pytest not found. Installing...")
-        if not run_command("pip install pytest", "Installing pytest"):
-            print("Failed to install pytest")
-            return False
+    else:
+        print(f"✗ {', '.join(missing)} not found. Installing...")
+        if not run_command([sys.executable, "-m", "pip", "install", *missing], "Installing test dependencies"):
+            print("Failed to install test dependencies")
+            return 1
     
-    # Run different test suites
-    test_suites = [
-        {
-            "name": "Unit Tests",
-            "command": "python -m pytest tests/test_marzpay.py tests/test_collections.py tests/test_disbursements.py tests/test_phone_verification.py tests/test_utilities.py -v",
-            "description": "Running unit tests for all components"
-        },
-        {
-            "name": "Integration Tests",
-            "command": "python -m pytest tests/test_integration.py -v -m integration",
-            "description": "Running integration tests"
-        },
-        {
-            "name": "All Tests",
-            "command": "python -m pytest tests/ -v --tb=short",
-            "description": "Running all tests"
-        },
-        {
-            "name": "Test Coverage",
-            "command": "python -m pytest tests/ --cov=marzpay --cov-report=html --cov-report=term",
-            "description": "Running tests with coverage"
-        }
+    # Run the whole suite once, spread across all CPUs, with coverage
+    command = [
+        sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short", "-n", "auto",
+        "--cov=marzpay", "--cov-report=html", "--cov-report=term",
     ]
     
-    results = {}
-    
-    for suite in test_suites:
-        print(f"\n{'='*60}")
-        print(f"Test Suite: {suite['name']}")
-        print(f"{'='*60}")
-        
-        success = run_command(suite['command'], suite['description'])
-        results[suite['name']] = success
-        
-        if not success:
-            print(f"❌ {suite['name']} failed")
-        else:
-            print(f"✅ {suite['name']} passed")
+    success = run_command(command, "Running all tests in parallel with coverage")
     
     # Summary
     print(f"\n{'='*60}")
     print("TEST SUMMARY")
     print(f"{'='*60}")
     
-    for name, success in results.items():
-        status = "✅ PASSED" if success else "❌ FAILED"
-        print(f"{name}: {status}")
-    
-    # Check if all tests passed
-    all_passed = all(results.values())
+    status = "✅ PASSED" if success else "❌ FAILED"
+    print(f"All Tests: {status}")
     
-    if all_passed:
+    if success:
         print("\n🎉 All tests passed!")
         return 0
     else:
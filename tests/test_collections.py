@@ -2,6 +2,9 @@
 Test cases for Collections API
 """
 
+import asyncio
+import time
+import uuid
 import pytest
 from unittest.mock import Mock, patch
 from marzpay import MarzPay
@@ -90,6 +93,151 @@ class TestCollectionsAPI:
                 "amount": -100
             })
         assert "amount must be a positive number" in str(exc_info.value)
+        
+        # Invalid phone number
+        with pytest.raises(MarzPayError) as exc_info:
+            self.client.collections.collect_money({
+                "phone_number": "12-34",
+                "amount": 1000
+            })
+        assert exc_info.value.code == "INVALID_PHONE_NUMBER"
+        
+        # Foreign and over-long numbers are not Uganda numbers
+        for phone_number in ("+1 (415) 555-2671", "12345678901", "2567599838530"):
+            with pytest.raises(MarzPayError) as exc_info:
+                self.client.collections.collect_money({
+                    "phone_number": phone_number,
+                    "amount": 1000
+                })
+            assert exc_info.value.code == "INVALID_PHONE_NUMBER"
+
+    def test_make_collector(self):
+        """Test collector with preset callback_url and country"""
+        with patch.object(self.client, 'request') as mock_request:
+            mock_request.return_value = {"status": "success"}
+            
+            collect = self.client.collections.make_collector(
+                callback_url="https://example.com/webhook"
+            )
+            result = collect(1000, "0759983853", reference="ref-1")
+            
+            assert result["status"] == "success"
+            mock_request.assert_called_once_with(
+                '/collect-money',
+                method='POST',
+                data={
+                    'amount': '1000',
+                    'phone_number': '+256759983853',
+                    'reference': 'ref-1',
+                    'description': 'Payment for services',
+                    'callback_url': 'https://example.com/webhook',
+                    'country': 'UG'
+                },
+                content_type='multipart'
+            )
+
+    def test_collect_money_errors_dry_run(self):
+        """Test aggregated validation without sending a request"""
+        collections = self.client.collections
+        
+        assert collections.collect_money_errors(
+            {"phone_number": "256759983853", "amount": 1000}
+        ) == []
+        
+        assert collections.collect_money_errors({"amount": -100}) == [
+            "phone_number is required",
+            "amount must be a positive number",
+        ]
+        
+        assert collections.collect_money_errors(
+            {"phone_number": "abc", "amount": 1000}
+        ) == ["phone_number format is invalid"]
+        
+        assert collections.collect_money_errors(
+            {"phone_number": "+1 (415) 555-2671", "amount": 1000}
+        ) == ["phone_number format is invalid"]
+        
+        for phone_number in ("0759983853", "256759983853", "+256 759 983 853", "759983853"):
+            assert collections.collect_money_errors(
+                {"phone_number": phone_number, "amount": 1000}
+            ) == []
+        
+        assert collections.collect_money_errors({}) == [
+            "phone_number is required",
+            "amount is required",
+        ]
+
+    def test_collect_many(self):
+        """Test concurrent money collection"""
+        with patch.object(self.client, 'request') as mock_request:
+            mock_request.side_effect = lambda *args, **kwargs: {
+                "status": "success",
+                "reference": kwargs['data']['reference'],
+            }
+            
+            items = [
+                {"phone_number": "0759983853", "amount": 1000, "reference": f"ref-{i}"}
+                for i in range(5)
+            ]
+            
+            results = asyncio.run(self.client.collections.collect_many(items, max_concurrency=2))
+            
+            assert [result["reference"] for result in results] == [f"ref-{i}" for i in range(5)]
+            assert mock_request.call_count == 5
+
+    def test_collect_many_reports_per_item_failures(self):
+        """Test that one failed request does not hide the other results"""
+        def fake_request(*args, **kwargs):
+            reference = kwargs['data']['reference']
+            if reference == "bad":
+                raise MarzPayError("Request failed", "REQUEST_FAILED", 500)
+            return {"status": "success", "reference": reference}
+        
+        with patch.object(self.client, 'request', side_effect=fake_request) as mock_request:
+            items = [
+                {"phone_number": "0759983853", "amount": 1000, "reference": reference}
+                for reference in ("a", "bad", "b", "c")
+            ]
+            
+            results = asyncio.run(self.client.collections.collect_many(items))
+            
+            assert mock_request.call_count == 4
+            assert results[0] == {"status": "success", "reference": "a"}
+            assert isinstance(results[1], MarzPayError)
+            assert results[1].code == "REQUEST_FAILED"
+            assert results[2] == {"status": "success", "reference": "b"}
+            assert results[3] == {"status": "success", "reference": "c"}
+
+    def test_collect_many_validates_before_sending(self):
+        """Test that no request is sent when any item is invalid"""
+        with patch.object(self.client, 'request') as mock_request:
+            items = [
+                {"phone_number": "0759983853", "amount": 1000},
+                {"phone_number": "0759983853", "amount": -1},
+            ]
+            
+            with pytest.raises(MarzPayError) as exc_info:
+                asyncio.run(self.client.collections.collect_many(items))
+            
+            assert exc_info.value.message == "items[1]: amount must be a positive number"
+            assert exc_info.value.code == "INVALID_AMOUNT"
+            assert exc_info.value.details["index"] == 1
+            mock_request.assert_not_called()
+
+    def test_collect_many_invalid_max_concurrency(self):
+        """Test that max_concurrency below 1 is rejected instead of hanging"""
+        with patch.object(self.client, 'request') as mock_request:
+            items = [{"phone_number": "0759983853", "amount": 1000}]
+            
+            for max_concurrency in (0, -1):
+                with pytest.raises(MarzPayError) as exc_info:
+                    asyncio.run(asyncio.wait_for(
+                        self.client.collections.collect_many(items, max_concurrency=max_concurrency),
+                        timeout=1,
+                    ))
+                assert exc_info.value.code == "INVALID_MAX_CONCURRENCY"
+            
+            mock_request.assert_not_called()
 
     def test_get_collection_details(self):
         """Test getting collection details"""
@@ -117,6 +265,36 @@ class TestCollectionsAPI:
             assert result["status"] == "success"
             mock_request.assert_called_once_with('/collect-money/services')
 
+    def test_get_services_cached(self):
+        """Test that services are cached until invalidated or expired"""
+        with patch.object(self.client, 'request') as mock_request:
+            mock_request.return_value = {"status": "success"}
+            
+            self.client.collections.get_services()
+            self.client.collections.get_services()
+            assert mock_request.call_count == 1
+            
+            self.client.collections.invalidate_services()
+            self.client.collections.get_services()
+            assert mock_request.call_count == 2
+            
+            with patch('marzpay.classes.collections.time.monotonic', return_value=time.monotonic() + 301):
+                self.client.collections.get_services()
+            assert mock_request.call_count == 3
+
+    def test_get_services_cache_not_shared(self):
+        """Test that modifying a returned response does not change the cache"""
+        with patch.object(self.client, 'request') as mock_request:
+            mock_request.return_value = {"status": "success", "data": {"services": ["mtn", "airtel"]}}
+            
+            first = self.client.collections.get_services()
+            first["data"]["services"].remove("mtn")
+            second = self.client.collections.get_services()
+            second["data"]["services"].clear()
+            
+            assert mock_request.call_count == 1
+            assert self.client.collections.get_services()["data"]["services"] == ["mtn", "airtel"]
+
     def test_phone_number_formatting(self):
         """Test phone number formatting"""
         # Test local number
@@ -130,6 +308,10 @@ class TestCollectionsAPI:
         # Test number with + prefix
         formatted = self.client.collections._format_phone_number("+256759983853")
         assert formatted == "+256759983853"
+        
+        # Test number with separators
+        formatted = self.client.collections._format_phone_number("0759 983-853")
+        assert formatted == "+256759983853"
 
     def test_generate_uuid(self):
         """Test UUID generation"""
@@ -161,7 +343,18 @@ class TestCollectionsAPI:
             )
             
             # Should call the base collections endpoint with filters
-            mock_request.assert_called_once()
+            mock_request.assert_called_once_with(
+                '/collections?limit=10&page=1&status=completed'
+            )
+
+    def test_get_collections_encodes_filters(self):
+        """Test that filter values are URL-encoded"""
+        with patch.object(self.client, 'request') as mock_request:
+            mock_request.return_value = {"status": "success", "data": []}
+            
+            self.client.collections.get_collections(status="a&b c")
+            
+            mock_request.assert_called_once_with('/collections?status=a%26b+c')
 
     def test_generate_reference(self):
         """Test reference generation"""
@@ -169,3 +362,6 @@ class TestCollectionsAPI:
         
         assert len(ref) == 36  # Standard UUID length
         assert ref.count('-') == 4  # Standard UUID format
+        assert uuid.UUID(ref).version == 4
+        assert uuid.UUID(ref).variant == uuid.RFC_4122
+        assert str(uuid.UUID(ref)) == ref
@@ -59,10 +59,19 @@ class TestMarzPay:
         """Test updating credentials at runtime"""
         client = MarzPay(api_key="old_key", api_secret="old_secret")
         
-        client.set_credentials("new_key", "new_secret")
+        with patch.object(client, 'request') as mock_request:
+            mock_request.return_value = {"status": "success"}
+            client.collections.get_services()
+            
+            client.set_credentials("new_key", "new_secret")
+            
+            # Services cached for the old account must be fetched again
+            client.collections.get_services()
+            assert mock_request.call_count == 2
         
         assert client.config["api_key"] == "new_key"
         assert client.config["api_secret"] == "new_secret"
+        assert client.session.headers["Authorization"] == client.get_auth_header()
 
     def test_set_credentials_validation(self):
         """Test credential validation"""
@@ -209,3 +218,11 @@ class TestMarzPay:
         
         assert "Network error" in str(exc_info.value)
         assert exc_info.value.code == "NETWORK_ERROR"
+
+    def test_context_manager_closes_session(self):
+        """Test that the client closes its session when used as a context manager"""
+        with patch('requests.Session.close') as mock_close:
+            with MarzPay(api_key="test_key", api_secret="test_secret") as client:
+                assert client.session.headers["Authorization"] == client.get_auth_header()
+            
+            mock_close.assert_called_once()
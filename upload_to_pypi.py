@@ -12,16 +12,25 @@ import sys
 
 
 def run_command(cmd, description):
-    """Run a command and handle errors"""
+    """Run a command (an argv list, no shell) and handle errors"""
     print(f"🔄 {description}...")
-    try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed:")
-        print(f"   Error: {e.stderr}")
+    # Stream output as it is produced instead of buffering it all in memory
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    for line in process.stdout:
+        print(f"   {line}", end="")
+    process.wait()
+    
+    if process.returncode != 0:
+        print(f"❌ {description} failed (exit status {process.returncode})")
         return False
+    print(f"✅ {description} completed successfully")
+    return True
 
 
 def main():
@@ -43,7 +52,7 @@ def main():
         return
     
     # Check if package files exist
-    dist_files = os.listdir('dist')
+    dist_files = [entry.name for entry in os.scandir('dist') if entry.is_file()]
     if not dist_files:
         print("❌ No package files found in dist/")
         print("   Please run: python -m build")
@@ -62,7 +71,8 @@ def main():
         return
     
     # Upload to PyPI
-    if not run_command("python -m twine upload dist/*", "Uploading to PyPI"):
+    upload_cmd = [sys.executable, "-m", "twine", "upload", *(os.path.join('dist', f) for f in dist_files)]
+    if not run_command(upload_cmd, "Uploading to PyPI"):
         return
     
     print("\n🎉 Upload completed successfully!")